@@ -1,5 +1,3 @@
-from io import BytesIO
-
 from httpcord import (
     CommandResponse,
     HTTPBot,
@@ -22,22 +20,22 @@ bot = HTTPBot(
 )
 
 
-@bot.command("attachment-response")
+@bot.command("attachment-response", auto_defer=True)
 async def attachment_response(interaction: Interaction, *, attachment: Attachment) -> CommandResponse:
-    attachment_request = await interaction.bot.http._session.get(attachment.url)
-    attachment_data = await attachment_request.read()
-    attachment_bytes = BytesIO(attachment_data)
-    attachment_bytes.seek(0)
-    return CommandResponse(
-        type=InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
-        content=f"You uploaded an attachment with name: {attachment.filename}, i've attached it to this message!",
-        files=[
-            File(
-                fp=attachment_bytes,
-                filename=attachment.filename,
-            )
-        ],
-    )
+    # The download is streamed straight into the upload, so the response is held open until the followup is sent.
+    async with interaction.bot.session.get(attachment.url) as attachment_request:
+        response = CommandResponse(
+            type=InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+            content=f"You uploaded an attachment with name: {attachment.filename}, i've attached it to this message!",
+            files=[
+                File(
+                    fp=attachment_request.content,
+                    filename=attachment.filename,
+                )
+            ],
+        )
+        await interaction.followup(response)
+    return CommandResponse(InteractionResponseType.PONG)
 
 
 bot.start(CLIENT_TOKEN)
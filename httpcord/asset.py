@@ -29,16 +29,20 @@ class Asset:
     __slots__: tuple[str, ...] = (
         "_base_url",
         "_code",
+        "_animated",
+        "_urls",
     )
 
     def __init__(self, base_url: str, code: str) -> None:
         self._base_url: str = base_url
         self._code: str = code
+        self._animated: bool = code.startswith("a_") if code else False
+        self._urls: dict[tuple[bool, int], str] = {}
 
     @property
     def animated(self) -> bool:
         """Whether the avatar is animated."""
-        return self.code.startswith("a_") if self._code else False
+        return self._animated
 
     @property
     def code(self) -> str:
@@ -47,5 +51,9 @@ class Asset:
 
     def url(self, *, animated: bool | None = None, size: int = 1024) -> str:
         """The URL of the avatar."""
-        animated = self.animated if animated is None else animated
-        return f"{self._base_url}/{self._code}.{'png' if not animated else 'gif'}?size={size}"
+        animated = self._animated if animated is None else animated
+        url = self._urls.get((animated, size))
+        if url is None:
+            url = f"{self._base_url}/{self._code}.{'png' if not animated else 'gif'}?size={size}"
+            self._urls[(animated, size)] = url
+        return url
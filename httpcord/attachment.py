@@ -24,6 +24,8 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import sys
+
 
 __all__: tuple[str, ...] = ("Attachment",)
 
@@ -40,23 +42,25 @@ class Attachment:
         "proxy_url",
         "size",
         "url",
-        "_content",
     )
 
     @classmethod
     def from_option(cls, data: dict) -> Attachment:
-        return cls(
-            content_type=data["content_type"],
-            filename=data["filename"],
-            id=int(data["id"]),
-            height=data["height"],
-            width=data["width"],
-            placeholder=data["placeholder"],
-            placeholder_version=data["placeholder_version"],
-            proxy_url=data["proxy_url"],
-            size=data["size"],
-            url=data["url"],
-        )
+        # Hot path when resolving attachment options, so the slots are written
+        # directly rather than going through the keyword-argument constructor.
+        attachment = cls.__new__(cls)
+        # MIME types repeat heavily across attachments, so share a single string per type.
+        attachment.content_type = sys.intern(data["content_type"])
+        attachment.filename = data["filename"]
+        attachment.id = int(data["id"])
+        attachment.height = data["height"]
+        attachment.width = data["width"]
+        attachment.placeholder = data["placeholder"]
+        attachment.placeholder_version = data["placeholder_version"]
+        attachment.proxy_url = data["proxy_url"]
+        attachment.size = data["size"]
+        attachment.url = data["url"]
+        return attachment
 
     def __init__(
         self,
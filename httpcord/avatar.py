@@ -12,28 +12,38 @@ __all__: tuple[str, ...] = (
 
 NUMBER_OF_DEFAULT_AVATARS: Final[int] = 6
 
+_EPOCH: Final[datetime.datetime] = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
 
 class AvatarDecoration:
-    __slots__: tuple[str, ...] = ("_data",)
+    __slots__: tuple[str, ...] = (
+        "_asset",
+        "_expires_at",
+        "_id",
+    )
 
     def __init__(self, data: dict) -> None:
-        self._data: dict = data
+        self._asset: Asset | None = (
+            Asset("https://cdn.discordapp.com/avatar-decoration-presets", data["code"]) if "code" in data else None
+        )
+        self._expires_at: datetime.datetime | None = (
+            _EPOCH + datetime.timedelta(seconds=int(data["expires_at"]))
+            if data.get("expires_at") is not None
+            else None
+        )
+        self._id: str | None = data.get("id")
 
     @property
     def asset(self) -> Asset | None:
         """The avatar decoration asset."""
-        if "code" not in self._data:
-            return None
-        return Asset(f"https://cdn.discordapp.com/avatar-decoration-presets", self._data["code"])
+        return self._asset
 
     @property
     def expires_at(self) -> datetime.datetime | None:
         """The expiration date of the avatar decoration."""
-        if self._data["expires_at"] is None:
-            return None
-        return datetime.datetime.fromtimestamp(int(self._data["expires_at"]), tz=datetime.timezone.utc)
+        return self._expires_at
 
     @property
     def id(self) -> str | None:
         """The ID of the avatar decoration."""
-        return self._data.get("id")
+        return self._id
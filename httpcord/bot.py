@@ -24,7 +24,10 @@ SOFTWARE.
 
 from __future__ import annotations
 
-import enum
+import asyncio
+import hashlib
+import logging
+import os
 from http import HTTPStatus
 from typing import (
     TYPE_CHECKING,
@@ -36,9 +39,17 @@ from typing import (
     overload,
 )
 
+import orjson
 import uvicorn
+from aiohttp import ClientSession
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import (
+    JSONResponse,
+    ORJSONResponse,
+    Response,
+)
+from nacl.bindings import crypto_sign_BYTES, crypto_sign_open
+from nacl.exceptions import BadSignatureError
 from nacl.signing import VerifyKey
 
 from httpcord.attachment import Attachment
@@ -47,8 +58,15 @@ from httpcord.command import (
     Command,
     CommandData,
 )
-from httpcord.command.base import InteractionContextType
-from httpcord.command.types import ApplicationCommandOptionType
+from httpcord.command.base import (
+    RESOLVE_ATTACHMENT,
+    RESOLVE_CHANNEL,
+    RESOLVE_ENUM,
+    RESOLVE_MEMBER,
+    RESOLVE_ROLE,
+    RESOLVE_USER,
+    InteractionContextType,
+)
 from httpcord.enums import (
     ApplicationCommandType,
     ApplicationIntegrationType,
@@ -60,14 +78,14 @@ from httpcord.func_protocol import AutocompleteFunc
 from httpcord.http import HTTP, Route
 from httpcord.interaction import CommandResponse, Interaction
 from httpcord.locale import Locale, LocaleDict
-from httpcord.member import Member
 from httpcord.types import JSONResponseError, JSONResponseType
-from httpcord.user import User
 
 
 __all__: Final[tuple[str, ...]] = ("HTTPBot",)
 
 
+_LOG: Final[logging.Logger] = logging.getLogger("httpcord")
+
 DEFAULT_FASTAPI_KWARGS: Final[dict[str, Any]] = {
     "debug": False,
     "title": "Discord HTTPBot - Python FastAPI https://git.uwu.gal/pyhttpcord",
@@ -78,13 +96,29 @@ DEFAULT_FASTAPI_KWARGS: Final[dict[str, Any]] = {
     "include_in_schema": False,
 }
 
-ERROR_BAD_SIGNATURE_REQUEST: Final[JSONResponse] = JSONResponse(
+ERROR_BAD_SIGNATURE_REQUEST: Final[JSONResponse] = ORJSONResponse(
     status_code=HTTPStatus.UNAUTHORIZED,
     content=JSONResponseError(
         error="Bad request signature",
     ),
 )
 
+PONG_RESPONSE: Final[JSONResponse] = ORJSONResponse(
+    status_code=HTTPStatus.OK,
+    content=JSONResponseType(
+        type=InteractionResponseType.PONG,
+    ),
+)
+
+# Shown in place of the deferred response when a deferred command raises.
+DEFERRED_COMMAND_ERROR_MESSAGE: Final[str] = "An error occurred while running this command."
+
+# Webhook response for interactions already responded to through the callback endpoint, which Discord ignores.
+ALREADY_RESPONDED_RESPONSE: Final[JSONResponse] = ORJSONResponse(
+    status_code=HTTPStatus.OK,
+    content=None,
+)
+
 
 class HTTPBot:
     __slots__: Final[tuple[str, ...]] = (
@@ -92,9 +126,16 @@ class HTTPBot:
         "_token",
         "_id",
         "_public_key",
+        "_verify_key",
+        "_verify_key_bytes",
         "_register_commands_on_startup",
         "_fastapi",
         "_commands",
+        "_command_index",
+        "_command_payloads",
+        "_cached_responses",
+        "_background_tasks",
+        "_commands_cache_path",
         "_uri_path",
         "_on_startup",
         "_on_shutdown",
@@ -109,6 +150,7 @@ class HTTPBot:
         uri_path: str = "/api/interactions",
         on_startup: Callable[[], Coroutine[Any, Any, None]] | None = None,
         on_shutdown: Callable[[], Coroutine[Any, Any, None]] | None = None,
+        commands_cache_path: str | os.PathLike | None = None,
         **kwargs: Any,
     ) -> None:
         """Create an HTTPBot client."""
@@ -118,6 +160,8 @@ class HTTPBot:
         self._on_startup: Callable[[], Coroutine[Any, Any, None]] | None = on_startup
         self._on_shutdown: Callable[[], Coroutine[Any, Any, None]] | None = on_shutdown
         self._public_key: Final[str] = client_public_key
+        self._verify_key: Final[VerifyKey] = VerifyKey(bytes.fromhex(client_public_key))
+        self._verify_key_bytes: Final[bytes] = self._verify_key.encode()
         self._register_commands_on_startup = register_commands_on_startup
         self._fastapi = FastAPI(
             **DEFAULT_FASTAPI_KWARGS,
@@ -131,14 +175,27 @@ class HTTPBot:
             ApplicationCommandType.MESSAGE: {},
             ApplicationCommandType.PRIMARY_ENTRY_POINT: {},
         }
+        self._command_index: dict[tuple[int, str], Command] = {}
+        self._command_payloads: dict[tuple[ApplicationCommandType, str], dict[str, Any]] = {}
+        self._cached_responses: dict[Command, tuple[tuple[Any, ...], Response]] = {}
+        self._background_tasks: set[asyncio.Task[None]] = set()
+        self._commands_cache_path: str | os.PathLike | None = commands_cache_path
         self._uri_path: str = uri_path
-        self._fastapi.add_api_route(
+        # Registered as a plain Starlette route, skipping FastAPI's dependency solving and response
+        # serialisation, as the endpoint reads the raw body and always returns a ready-made response.
+        self._fastapi.router.add_route(
             path=self._uri_path,
             endpoint=self._interaction_http_callback,
             name="HTTP Interaction Bot entry point",
             methods=["POST"],
+            include_in_schema=False,
         )
 
+    @property
+    def session(self) -> ClientSession:
+        """The client session shared across the bot's lifetime, for making your own HTTP requests."""
+        return self.http.session
+
     if TYPE_CHECKING:
 
         @overload
@@ -156,6 +213,7 @@ class HTTPBot:
                 ApplicationCommandType.MESSAGE,
             ] = ...,
             auto_defer: bool = ...,
+            cache_response: bool = ...,
             name_localisations: LocaleDict | None = ...,
             description_localisations: LocaleDict | None = ...,
             option_localisations: dict[str, Locale] | None = ...,
@@ -172,6 +230,7 @@ class HTTPBot:
             autocompletes: dict[str, AutocompleteFunc] | None = ...,
             command_type: Literal[ApplicationCommandType.CHAT_INPUT] = ...,
             auto_defer: bool = ...,
+            cache_response: bool = ...,
             name_localisations: LocaleDict | None = ...,
             description_localisations: LocaleDict | None = ...,
             option_localisations: dict[str, Locale] | None = ...,
@@ -187,11 +246,15 @@ class HTTPBot:
         autocompletes: dict[str, AutocompleteFunc] | None = None,
         command_type: ApplicationCommandType = ApplicationCommandType.CHAT_INPUT,
         auto_defer: bool = False,
+        cache_response: bool = False,
         name_localisations: LocaleDict | None = None,
         description_localisations: LocaleDict | None = None,
         option_localisations: dict[str, Locale] | None = None,
     ):
-        """Register a command with the bot."""
+        """Register a command with the bot.
+
+        Set `cache_response` for commands whose response rarely changes, see `Command.cache_response`.
+        """
 
         if command_type not in self._commands:
             raise ValueError(f"Invalid command type {command_type}")
@@ -200,25 +263,35 @@ class HTTPBot:
             if not command_type == ApplicationCommandType.CHAT_INPUT and autocompletes is not None:
                 raise ValueError("Autocompletes are only supported for `ApplicationCommandType.CHAT_INPUT` commands")
 
-            self._commands[command_type][name] = Command(
+            command = Command(
                 func=func,
                 name=name,
-                allowed_contexts=set(allowed_contexts) if allowed_contexts else None,
-                integration_types=set(integration_types) if integration_types else None,
+                allowed_contexts=frozenset(allowed_contexts) if allowed_contexts else None,
+                integration_types=frozenset(integration_types) if integration_types else None,
                 description=description,
                 command_type=command_type,  # pyright: ignore[reportCallIssue, reportArgumentType]
                 autocompletes=autocompletes,
                 auto_defer=auto_defer,
+                cache_response=cache_response,
                 name_localisations=name_localisations,
                 description_localisations=description_localisations,
                 option_localisations=option_localisations,
             )
+            self._add_command(command)
 
         return _decorator
 
     def register_command(self, command: Command) -> None:
         """ Register a non-decorator command with the bot, or a command group. """
+        self._add_command(command)
+
+    def _add_command(self, command: Command) -> None:
         self._commands[command.command_type][command._name] = command
+        # Flat index used at dispatch time, keyed by the raw command type integer Discord sends.
+        self._command_index[(command.command_type.value, command._name)] = command
+        # The registration payload is built here rather than at startup, so startup
+        # only has to hash the already compiled payloads.
+        self._command_payloads[(command.command_type, command._name)] = command.to_dict()
 
     async def _verify_signature(self, request: Request) -> bool:
         signature: str | None = request.headers.get("X-Signature-Ed25519")
@@ -226,23 +299,25 @@ class HTTPBot:
         if signature is None or timestamp is None:
             return False
         else:
-            message = timestamp.encode() + await request.body()
+            # Verified against the raw body, so nothing attacker-controlled is parsed before this passes.
+            # The signature is joined onto the message here, as PyNaCl would otherwise concatenate the
+            # two again itself, copying the whole body a second time. libsodium is called directly, the
+            # key having been validated by VerifyKey up front.
             try:
-                vk = VerifyKey(bytes.fromhex(self._public_key))
-                vk.verify(message, bytes.fromhex(signature))
-            except Exception:
+                raw_signature = bytes.fromhex(signature)
+                # The signature has a fixed length, otherwise its boundary with the timestamp could be moved.
+                if len(raw_signature) != crypto_sign_BYTES:
+                    return False
+                signed_message = b"".join((raw_signature, timestamp.encode(), await request.body()))
+                crypto_sign_open(signed_message, self._verify_key_bytes)
+            except (BadSignatureError, ValueError):
                 return False
         return True
 
-    async def _handle_verified_interaction(self, request: Request) -> JSONResponse:
-        request_json = await request.json()
+    async def _handle_verified_interaction(self, request: Request) -> Response:
+        request_json = orjson.loads(await request.body())
         if request_json["type"] == InteractionType.PING:
-            return JSONResponse(
-                status_code=HTTPStatus.OK,
-                content=JSONResponseType(
-                    type=InteractionResponseType.PONG,
-                ),
-            )
+            return PONG_RESPONSE
         elif request_json["type"] == InteractionType.APPLICATION_COMMAND_AUTOCOMPLETE:
             return await self.__process_autocompletes(request, request_json)
         return await self.__process_commands(request, request_json)
@@ -251,61 +326,88 @@ class HTTPBot:
         return Interaction(request, data, self)
 
     async def ___get_command_data(self, request: Request, data: dict[str, Any]) -> CommandData | None:
-        command_name: str | None = data.get("data", {}).get("name", None)
-        command_type: ApplicationCommandType | None = data.get("data", {}).get("type", None)
-        if command_type is None or command_name is None:
-            return None
-        if command_type not in self._commands:
-            raise UnknownCommand(f"Unknown command type {command_type}")
-        command = self._commands[command_type].get(command_name, None)
-        if not command:
+        # Discord always sends the command type and name for command and autocomplete interactions,
+        # component and modal interactions lack them and are not handled.
+        try:
+            interaction_data: dict[str, Any] = data["data"]
+            command_key = (interaction_data["type"], interaction_data["name"])
+        except KeyError:
+            raise UnknownCommand(f"Unsupported interaction type: {data.get('type')}")
+        command = self._command_index.get(command_key)
+        if command is None:
             return None
 
         interaction = await self.___create_interaction(request, command, data)
-        return CommandData(command=command, options=data["data"].get("options", []), interaction=interaction)
+        return CommandData(command=command, options=interaction_data.get("options", []), interaction=interaction)
 
-    async def __process_commands(self, request: Request, data: dict[str, Any]) -> Any:
+    async def __process_commands(self, request: Request, data: dict[str, Any]) -> Response:
         command_data = await self.___get_command_data(request, data)
         if not command_data:
-            error_message = f"Unknown command used: {data.get('data', {}).get('name', 'N/A')}"  # Add context to error
+            error_message = f"Unknown command used: {data['data']['name']}"  # Add context to error
             raise UnknownCommand(error_message)  # Raise with more details for better logging or handling upstream
         command = command_data.command
         interaction = command_data.interaction
         options = command_data.options_formatted
-        for option_name in options.keys():
-            kwarg_type = command._func.__annotations__[option_name]
+        for option_name, resolver, enum_type in command.option_resolvers:
+            if option_name not in options:
+                continue
             option_value = options[option_name]
-            if kwarg_type.__class__ == enum.EnumType:
-                # sorry
-                options[option_name] = getattr(kwarg_type, option_value)
-        if command._auto_defer:
-            await interaction.defer()
-
-        command_options = command.options or {}
-        for option_name, option_value in options.items():
-            if command_options[option_name]._type == ApplicationCommandOptionType.ATTACHMENT:
+            if resolver == RESOLVE_ENUM:
+                options[option_name] = getattr(enum_type, option_value)
+            elif resolver == RESOLVE_ATTACHMENT:
                 options[option_name] = Attachment.from_option(data["data"]["resolved"]["attachments"][option_value])
-            elif command_options[option_name]._type == ApplicationCommandOptionType.CHANNEL:
+            elif resolver == RESOLVE_CHANNEL:
                 options[option_name] = interaction.resolved.channels[int(option_value)]
-            elif command_options[option_name]._type == ApplicationCommandOptionType.ROLE:
+            elif resolver == RESOLVE_ROLE:
                 options[option_name] = interaction.resolved.roles[int(option_value)]
-            elif command_options[option_name]._native_type == Member:
+            elif resolver == RESOLVE_MEMBER:
                 options[option_name] = interaction.resolved.members[int(option_value)]
-            elif command_options[option_name]._native_type == User:
+            elif resolver == RESOLVE_USER:
                 options[option_name] = interaction.resolved.users[int(option_value)]
 
+        if command._auto_defer:
+            # Acknowledge the interaction in the webhook response straight away and run the command
+            # in the background, so slow commands don't hold the request open past Discord's deadline.
+            interaction._deferred = True
+            interaction._responded = True
+            task = asyncio.create_task(self.__process_deferred_command(command, interaction, options))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+            return ORJSONResponse(
+                status_code=HTTPStatus.OK,
+                content=JSONResponseType(
+                    type=InteractionResponseType.DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE,
+                ),
+            )
+
         response = await command.invoke(interaction, **options)
-        return await self.__process_response(response, interaction)
+        if not command._cache_response or len(response.files) != 0:
+            return await self.__process_response(response, interaction)
+
+        # The callback still runs every time, only the serialised response is reused while it stays the same.
+        response_key = (
+            response._type_value,
+            response._content,
+            response._flags,
+            [embed.to_dict() for embed in response._embeds],
+        )
+        cached_response = self._cached_responses.get(command)
+        if cached_response is not None and cached_response[0] == response_key:
+            return cached_response[1]
+        http_response = await self.__process_response(response, interaction)
+        self._cached_responses[command] = (response_key, http_response)
+        return http_response
 
     async def __process_response(
         self,
         response: CommandResponse,
         interaction: Interaction,
-    ) -> Any:
+    ) -> Response:
         if len(response.files) == 0:
-            return JSONResponse(
+            return Response(
                 status_code=HTTPStatus.OK,
-                content=response.to_dict(),
+                content=response.to_bytes(),
+                media_type="application/json",
             )
 
         if not interaction.deffered:
@@ -314,8 +416,43 @@ class HTTPBot:
                 ephemeral=response.ephemeral,
             )
 
-        json_payload = response.to_dict()["data"]
-        del json_payload["flags"]
+        await self.__edit_original_response(response, interaction)
+        return ALREADY_RESPONDED_RESPONSE
+
+    async def __process_deferred_command(
+        self,
+        command: Command,
+        interaction: Interaction,
+        options: dict[str, Any],
+    ) -> None:
+        try:
+            response = await command.invoke(interaction, **options)
+            if response.type == InteractionResponseType.PONG:
+                # The command already sent its own follow ups.
+                return
+            await self.__edit_original_response(response, interaction)
+        except Exception:
+            # Nothing awaits this task, so failures are logged here and the user is told the command failed
+            # rather than being left with the deferred "thinking" message.
+            _LOG.exception("Deferred command `%s` failed", command.name)
+            try:
+                await self.__edit_original_response(
+                    CommandResponse(
+                        type=InteractionResponseType.CHANNEL_MESSAGE_WITH_SOURCE,
+                        content=DEFERRED_COMMAND_ERROR_MESSAGE,
+                    ),
+                    interaction,
+                )
+            except Exception:
+                _LOG.exception("Failed to report the failure of deferred command `%s`", command.name)
+
+    async def __edit_original_response(
+        self,
+        response: CommandResponse,
+        interaction: Interaction,
+    ) -> None:
+        # Parts of the response payload are memoised, so the flags are left out of a copy rather than deleted from it.
+        json_payload = {key: value for key, value in response.to_dict()["data"].items() if key != "flags"}
         route = Route(
             url=f"/webhooks/{self._id}/{interaction._token}/messages/@original",
             json=json_payload,
@@ -323,9 +460,7 @@ class HTTPBot:
         )
         await self.http.patch(route)
 
-        return None
-
-    async def __process_autocompletes(self, request: Request, data: dict[str, Any]) -> JSONResponse:
+    async def __process_autocompletes(self, request: Request, data: dict[str, Any]) -> Response:
         command_data = await self.___get_command_data(request, data)
         if command_data:
             interaction = command_data.interaction
@@ -335,29 +470,58 @@ class HTTPBot:
                     autocomplete_func = command_data.command._autocompletes[option_name]
                     autocomplete_responses = await autocomplete_func(interaction, option_data["value"])
                     response = AutocompleteResponse(choices=autocomplete_responses)
-                    return JSONResponse(content=response.to_dict())
+                    return ORJSONResponse(content=response.to_dict())
         raise UnknownCommand(f"Unknown autocomplete used")
 
-    async def _interaction_http_callback(self, request: Request) -> JSONResponse:
+    async def _interaction_http_callback(self, request: Request) -> Response:
         verified_signature = await self._verify_signature(request)
         if not verified_signature:
             return ERROR_BAD_SIGNATURE_REQUEST
 
         return await self._handle_verified_interaction(request)
 
-    async def register_commands(self) -> None:
-        api_commands: list[dict[str, Any]] = [
-            command.to_dict() for commands in self._commands.values() for command in commands.values()
-        ]
-        await self.http.put(
+    def _read_commands_cache(self) -> str | None:
+        if self._commands_cache_path is None or not os.path.exists(self._commands_cache_path):
+            return None
+        with open(self._commands_cache_path, "rb") as f:
+            try:
+                cache: Any = orjson.loads(f.read())
+            except orjson.JSONDecodeError:
+                return None
+        if not isinstance(cache, dict) or cache.get("application_id") != self._id:
+            return None
+        return cache.get("commands_hash")
+
+    def _write_commands_cache(self, commands_hash: str) -> None:
+        if self._commands_cache_path is None:
+            return
+        with open(self._commands_cache_path, "wb") as f:
+            f.write(orjson.dumps({"application_id": self._id, "commands_hash": commands_hash}))
+
+    async def register_commands(self, *, force: bool = False) -> None:
+        """Register the bot's commands with Discord.
+
+        With a `commands_cache_path`, nothing is sent when the commands are unchanged since
+        they were last registered. Set `force` to register them regardless.
+        """
+        api_commands: list[dict[str, Any]] = list(self._command_payloads.values())
+        commands_hash = hashlib.sha256(orjson.dumps(api_commands, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        if not force and self._read_commands_cache() == commands_hash:
+            return
+
+        registered_commands = await self.http.put(
             Route(
                 f"/applications/{self._id}/commands",
                 json=api_commands,
             )
         )
+        # Discord responds with the list of registered commands on success, and an error object otherwise.
+        if isinstance(registered_commands, list):
+            self._write_commands_cache(commands_hash)
 
     async def _setup(self) -> None:
         self.http = HTTP(token=self._token)
+        await self.http.resolve_hosts()
         if self._register_commands_on_startup:
             await self.register_commands()
         if self._on_startup is not None:
@@ -366,7 +530,16 @@ class HTTPBot:
     async def _shutdown(self) -> None:
         if self._on_shutdown is not None:
             await self._on_shutdown()
+        # Deferred commands still running are let finish first, as they edit their response through the HTTP client.
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await self.http.close()
 
     def start(self, token: str, **kwargs: Any) -> None:
+        """Run the bot with uvicorn. Keyword arguments are passed through to `uvicorn.run`.
+
+        uvicorn picks uvloop and httptools when they are installed (see the `fast` extra), and
+        falls back to asyncio and h11 otherwise, e.g. on Windows. Access logging is off by default.
+        """
         self._token = token
+        kwargs.setdefault("access_log", False)
         uvicorn.run(app=self._fastapi, **kwargs)
@@ -59,9 +59,12 @@ class ChannelType(IntEnum):
     GUILD_MEDIA = 16
 
 
+"""Maps raw channel type values to their `ChannelType` member."""
+_CHANNEL_TYPES: dict[int, ChannelType] = {channel_type.value: channel_type for channel_type in ChannelType}
+
+
 class BaseChannel:
     __slots__: tuple[str, ...] = (
-        "_data",
         "_id",
         "_flags",
         "_type",
@@ -70,12 +73,16 @@ class BaseChannel:
     )
 
     def __init__(self, data: dict) -> None:
-        self._data = data
         self._id: int = int(data["id"])
         self._flags: int = data.get("flags", 0)
-        self._type: int = int(data["type"])
+        channel_type: int = data["type"]
+        # Channel types added to Discord after this library are kept as their raw value.
+        self._type: ChannelType | int = _CHANNEL_TYPES.get(channel_type, channel_type)
         self._last_message_id: int | None = int(data["last_message_id"]) if data.get("last_message_id") else None
-        self._last_pin_timestamp: str | None = data.get("last_pin_timestamp")
+        last_pin_timestamp: str | None = data.get("last_pin_timestamp")
+        self._last_pin_timestamp: datetime.datetime | None = (
+            from_timestamp(last_pin_timestamp) if last_pin_timestamp else None
+        )
 
     @property
     def id(self) -> int:
@@ -88,9 +95,9 @@ class BaseChannel:
         return self._flags
 
     @property
-    def type(self) -> ChannelType:
+    def type(self) -> ChannelType | int:
         """The channel type."""
-        return ChannelType(self._type)
+        return self._type
 
     @property
     def last_message_id(self) -> int | None:
@@ -100,20 +107,12 @@ class BaseChannel:
     @property
     def last_pin_timestamp(self) -> datetime.datetime | None:
         """The timestamp of the last pinned message in the channel."""
-        return from_timestamp(self._last_pin_timestamp) if self._last_pin_timestamp else None
+        return self._last_pin_timestamp
 
     @classmethod
     def from_data(cls, data: dict) -> BaseChannel:
         """Create a channel instance from raw data."""
-        channel_type = ChannelType(data["type"])
-        if channel_type == ChannelType.DM:
-            return DMChannel(data)
-        elif channel_type == ChannelType.GROUP_DM:
-            return GroupDMChannel(data)
-        elif channel_type in (ChannelType.GUILD_TEXT, ChannelType.GUILD_VOICE, ChannelType.GUILD_CATEGORY):
-            return GuildChannel(data)
-        else:
-            return BaseChannel(data)
+        return _CHANNEL_CLASSES.get(data["type"], BaseChannel)(data)
 
 
 class GuildChannel(BaseChannel):
@@ -187,11 +186,15 @@ class GuildChannel(BaseChannel):
 
 
 class DMChannel(BaseChannel):
-    __slots__: tuple[str, ...] = ("_recipients",)
+    __slots__: tuple[str, ...] = (
+        "_recipients",
+        "_recipient_users",
+    )
 
     def __init__(self, data: dict) -> None:
         super().__init__(data)
         self._recipients: list[dict] = data.get("recipients", [])
+        self._recipient_users: list[User] | None = None
 
     @property
     def type(self) -> Literal[ChannelType.DM]:
@@ -201,13 +204,16 @@ class DMChannel(BaseChannel):
     @property
     def recipients(self) -> list[User]:
         """The IDs of the users in the DM channel."""
-        return [User(recipient) for recipient in self._recipients]
+        if self._recipient_users is None:
+            self._recipient_users = [User(recipient) for recipient in self._recipients]
+        return self._recipient_users
 
 
 class GroupDMChannel(DMChannel):
     __slots__: tuple[str, ...] = (
         "_name",
         "_icon",
+        "_icon_asset",
         "_owner_id",
     )
 
@@ -215,6 +221,7 @@ class GroupDMChannel(DMChannel):
         super().__init__(data)
         self._name: str = data["name"]
         self._icon: str | None = data.get("icon")
+        self._icon_asset: Asset | None = None
         self._owner_id: int = int(data["owner_id"])
 
     @property
@@ -230,14 +237,12 @@ class GroupDMChannel(DMChannel):
     @property
     def icon(self) -> Asset | None:
         """The icon of the group DM channel."""
-        return (
-            Asset(
+        if self._icon and self._icon_asset is None:
+            self._icon_asset = Asset(
                 base_url=f"https://cdn.discordapp.com/channel-icons/{self.id}",
                 code=self._icon,
             )
-            if self._icon
-            else None
-        )
+        return self._icon_asset
 
     @property
     def owner_id(self) -> int:
@@ -245,6 +250,16 @@ class GroupDMChannel(DMChannel):
         return self._owner_id
 
 
+"""Maps channel types to the class representing them, anything missing is a plain `BaseChannel`."""
+_CHANNEL_CLASSES: dict[int, type[BaseChannel]] = {
+    ChannelType.DM: DMChannel,
+    ChannelType.GROUP_DM: GroupDMChannel,
+    ChannelType.GUILD_TEXT: GuildChannel,
+    ChannelType.GUILD_VOICE: GuildChannel,
+    ChannelType.GUILD_CATEGORY: GuildChannel,
+}
+
+
 Channel = Union[
     BaseChannel,
     GuildChannel,
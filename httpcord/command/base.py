@@ -25,16 +25,24 @@ SOFTWARE.
 from __future__ import annotations
 
 import enum
+import sys
 import types
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
+    Callable,
     Final,
     Literal,
+    get_args,
     overload,
 )
 
-from httpcord.command.types import Choice, CommandOption
+from httpcord.command.types import (
+    _SUB_COMMAND_OPTION_TYPES,
+    Choice,
+    CommandOption,
+)
 from httpcord.enums import (
     ApplicationCommandOptionType,
     ApplicationCommandType,
@@ -45,12 +53,15 @@ from httpcord.enums import (
 from httpcord.func_protocol import AutocompleteFunc, CommandFunc
 from httpcord.interaction import CommandResponse, Interaction
 from httpcord.locale import Locale, LocaleDict
+from httpcord.member import Member
 from httpcord.types import (
     TYPE_CONVERSION_TABLE,
     Float,
     Integer,
     String,
 )
+from httpcord.user import User
+from httpcord.utils.functions import drop_nulls
 
 
 __all__: Final[tuple[str, ...]] = (
@@ -60,6 +71,37 @@ __all__: Final[tuple[str, ...]] = (
 )
 
 
+"""Maps `Annotated` constraint types to the option settings they produce, avoiding a chain of type checks."""
+_ANNOTATED_OPTION_SETTINGS: Final[dict[type, Callable[[Any], dict[str, Any]]]] = {
+    Integer: lambda constraint: {"min_value": constraint.min_value, "max_value": constraint.max_value},
+    Float: lambda constraint: {"min_value": constraint.min_value, "max_value": constraint.max_value},
+    String: lambda constraint: {"min_length": constraint.min_length, "max_length": constraint.max_length},
+}
+
+
+# How a raw option value is converted before being passed to a command, see `Command.option_resolvers`.
+RESOLVE_ENUM: Final[int] = 0
+RESOLVE_ATTACHMENT: Final[int] = 1
+RESOLVE_CHANNEL: Final[int] = 2
+RESOLVE_ROLE: Final[int] = 3
+RESOLVE_MEMBER: Final[int] = 4
+RESOLVE_USER: Final[int] = 5
+
+
+DEFAULT_INTEGRATION_TYPES: Final[frozenset[ApplicationIntegrationType]] = frozenset(
+    {
+        ApplicationIntegrationType.GUILD_INSTALL,
+    }
+)
+DEFAULT_ALLOWED_CONTEXTS: Final[frozenset[InteractionContextType]] = frozenset(
+    {
+        InteractionContextType.BOT_DM,
+        InteractionContextType.GUILD,
+        InteractionContextType.PRIVATE_CHANNEL,
+    }
+)
+
+
 class Command:
     __slots__: Final[tuple[str, ...]] = (
         "_func",
@@ -68,12 +110,19 @@ class Command:
         "_description",
         "_autocompletes",
         "_auto_defer",
+        "_cache_response",
         "_sub_commands",
+        "_leaf_commands",
         "_is_sub_command_group",
         "_allowed_contexts",
         "_integration_types",
         "_locale",
         "_option_localisations",
+        "_parameters",
+        "_parameter_defaults",
+        "_options",
+        "_option_resolvers",
+        "_dict",
     )
 
     if TYPE_CHECKING:
@@ -88,12 +137,13 @@ class Command:
                 ApplicationCommandType.PRIMARY_ENTRY_POINT,
                 ApplicationCommandType.USER,
             ] = ...,
-            allowed_contexts: set[InteractionContextType] | None = ...,
-            integration_types: set[ApplicationIntegrationType] | None = ...,
+            allowed_contexts: AbstractSet[InteractionContextType] | None = ...,
+            integration_types: AbstractSet[ApplicationIntegrationType] | None = ...,
             description: None = ...,
             func: CommandFunc | None = ...,
             autocompletes: None = ...,
             auto_defer: bool = ...,
+            cache_response: bool = ...,
             sub_commands: None = ...,
             name_localisations: LocaleDict | None = ...,
             description_localisations: LocaleDict | None = ...,
@@ -106,12 +156,13 @@ class Command:
             *,
             name: str,
             command_type: Literal[ApplicationCommandType.CHAT_INPUT] = ...,
-            allowed_contexts: set[InteractionContextType] | None = ...,
-            integration_types: set[ApplicationIntegrationType] | None = ...,
+            allowed_contexts: AbstractSet[InteractionContextType] | None = ...,
+            integration_types: AbstractSet[ApplicationIntegrationType] | None = ...,
             description: str | None = ...,
             func: CommandFunc | None = ...,
             autocompletes: dict[str, AutocompleteFunc] | None = ...,
             auto_defer: bool = ...,
+            cache_response: bool = ...,
             sub_commands: None = ...,
             name_localisations: LocaleDict | None = ...,
             description_localisations: LocaleDict | None = ...,
@@ -124,12 +175,13 @@ class Command:
             *,
             name: str,
             command_type: Literal[ApplicationCommandType.CHAT_INPUT] = ...,
-            allowed_contexts: set[InteractionContextType] | None = ...,
-            integration_types: set[ApplicationIntegrationType] | None = ...,
+            allowed_contexts: AbstractSet[InteractionContextType] | None = ...,
+            integration_types: AbstractSet[ApplicationIntegrationType] | None = ...,
             description: str | None = ...,
             func: None = ...,
             autocompletes: None = ...,
             auto_defer: None = ...,
+            cache_response: None = ...,
             sub_commands: list[Command] = ...,
             name_localisations: LocaleDict | None = ...,
             description_localisations: LocaleDict | None = ...,
@@ -141,12 +193,13 @@ class Command:
         *,
         name: str,
         command_type: ApplicationCommandType | None = None,
-        allowed_contexts: set[InteractionContextType] | None = None,
-        integration_types: set[ApplicationIntegrationType] | None = None,
+        allowed_contexts: AbstractSet[InteractionContextType] | None = None,
+        integration_types: AbstractSet[ApplicationIntegrationType] | None = None,
         description: str | None = None,
         func: CommandFunc | None = None,
         autocompletes: dict[str, AutocompleteFunc] | None = None,
         auto_defer: bool | None = False,
+        cache_response: bool | None = False,
         sub_commands: list[Command] | None = None,
         name_localisations: LocaleDict | None = None,
         description_localisations: LocaleDict | None = None,
@@ -158,16 +211,15 @@ class Command:
             raise ValueError(f"Group command must have at least one sub command provided (`{name}`).")
 
         self._func: CommandFunc | None = func
-        self._name: str = name
+        # The callback's signature is inspected once here rather than on every options build or invocation.
+        self._parameters: dict[str, Any] = dict(list(func.__annotations__.items())[1:-1]) if func is not None else {}
+        self._parameter_defaults: dict[str, Any] = (func.__kwdefaults__ or {}) if func is not None else {}
+        self._name: str = sys.intern(name)
         self._description: str | None = description
-        self._integration_types: set[ApplicationIntegrationType] = integration_types or {
-            ApplicationIntegrationType.GUILD_INSTALL,
-        }
-        self._allowed_contexts: set[InteractionContextType] = allowed_contexts or {
-            InteractionContextType.BOT_DM,
-            InteractionContextType.GUILD,
-            InteractionContextType.PRIVATE_CHANNEL,
-        }
+        self._integration_types: AbstractSet[ApplicationIntegrationType] = (
+            integration_types or DEFAULT_INTEGRATION_TYPES
+        )
+        self._allowed_contexts: AbstractSet[InteractionContextType] = allowed_contexts or DEFAULT_ALLOWED_CONTEXTS
         self._locale: Locale = Locale(
             name_localisations=name_localisations,
             description_localisations=description_localisations,
@@ -176,7 +228,19 @@ class Command:
         self._command_type: ApplicationCommandType = command_type or ApplicationCommandType.CHAT_INPUT
         self._autocompletes: dict[str, AutocompleteFunc] = autocompletes or {}
         self._auto_defer: bool = auto_defer or False
+        self._cache_response: bool = cache_response or False
         self._sub_commands: dict[str, Command] = {sub_command.name: sub_command for sub_command in (sub_commands or [])}
+        # Every invokable command below this one, keyed by its path of sub command (group) names.
+        self._leaf_commands: dict[tuple[str, ...], Command] = {}
+        for sub_command_name, sub_command in self._sub_commands.items():
+            if sub_command.is_sub_command_group:
+                for path, leaf_command in sub_command._leaf_commands.items():
+                    self._leaf_commands[(sub_command_name, *path)] = leaf_command
+            else:
+                self._leaf_commands[(sub_command_name,)] = sub_command
+        self._options: dict[str, CommandOption] | None = self._build_options()
+        self._option_resolvers: tuple[tuple[str, int, Any], ...] | None = None
+        self._dict: dict[str, Any] | None = None
 
     @property
     def name(self) -> str:
@@ -198,53 +262,59 @@ class Command:
     def auto_defer(self) -> bool:
         return self._auto_defer
 
+    @property
+    def cache_response(self) -> bool:
+        """Whether the serialised response is reused while the callback returns the same content, flags and embeds."""
+        return self._cache_response
+
     @property
     def is_sub_command_group(self) -> bool:
         return len(self._sub_commands) > 0
 
     @property
-    def allowed_contexts(self) -> set[InteractionContextType]:
+    def allowed_contexts(self) -> AbstractSet[InteractionContextType]:
         return self._allowed_contexts
 
     @property
-    def integration_types(self) -> set[ApplicationIntegrationType]:
+    def integration_types(self) -> AbstractSet[ApplicationIntegrationType]:
         return self._integration_types
 
     @property
     def options(self) -> dict[str, CommandOption] | None:
+        """The command's options, built from its callback or sub commands on construction."""
+        return self._options
+
+    def _build_options(self) -> dict[str, CommandOption] | None:
         if self._func is None and len(self._sub_commands) == 0:
             return None
+        # User, message and entry point commands never take options.
+        if self._command_type is not ApplicationCommandType.CHAT_INPUT:
+            return None
         options: dict[str, CommandOption] = {}
         if self._func is not None:
-            raw_options = list(self._func.__annotations__.items())[1:-1]
-            default_options: dict[str, Any] = getattr(self._func, "__kwdefaults__") or {}
-            for option_name, option_value in raw_options:
-                required = not option_name in default_options
+            for option_name, option_value in self._parameters.items():
+                required = not option_name in self._parameter_defaults
                 choices: list[Choice] | None = None
-                if type(option_value) == types.UnionType:
-                    option_value = option_value.__args__[0]
-                if option_value.__class__ == enum.EnumType:
+                if option_value.__class__ is types.UnionType:
+                    option_value = get_args(option_value)[0]
+                if isinstance(option_value, type) and issubclass(option_value, enum.Enum):
                     choices = [Choice(name=v.value, value=k) for k, v in option_value.__members__.items()]
-                    option_value = option_value.__base__.__bases__[0]
+                    # The enum's value type, e.g. `str` for a StrEnum, unknown types falling back to a string below.
+                    option_value = next((base for base in option_value.__mro__ if base in TYPE_CONVERSION_TABLE), str)
                 option_settings: dict[str, Any] = {}
                 annotation_settings = getattr(option_value, "__dict__", {})
                 if annotation_settings.get("_name") == "Annotated":
                     if annotation_settings.get("__metadata__", None) is not None:
                         annotated_type = annotation_settings["__metadata__"][0]
                         option_value = annotation_settings["__origin__"]
-                        if type(annotated_type) in (Integer, Float):
-                            option_settings = {
-                                "min_value": annotated_type.min_value,
-                                "max_value": annotated_type.max_value,
-                            }
-                        elif type(annotated_type) in (String,):
-                            option_settings = {
-                                "min_length": annotated_type.min_length,
-                                "max_length": annotated_type.max_length,
-                            }
-
-                if option_value not in TYPE_CONVERSION_TABLE.keys():
+                        settings_factory = _ANNOTATED_OPTION_SETTINGS.get(type(annotated_type))
+                        if settings_factory is not None:
+                            option_settings = settings_factory(annotated_type)
+
+                option_type = TYPE_CONVERSION_TABLE.get(option_value)  # type: ignore[reportArgumentType]
+                if option_type is None:
                     option_value = str
+                    option_type = ApplicationCommandOptionType.STRING
 
                 option_description = None
                 option_localiser = self._option_localisations.get(option_name, None)
@@ -253,10 +323,10 @@ class Command:
                 options[option_name] = CommandOption(  # pyright: ignore[reportCallIssue]
                     name=option_name,
                     description=option_description,
-                    type=TYPE_CONVERSION_TABLE[option_value],  # type: ignore[reportArgumentType]
+                    type=option_type,  # type: ignore[reportArgumentType]
                     native_type=option_value,  # type: ignore[reportArgumentType]
                     required=required,
-                    autocomplete=option_name in self._autocompletes.keys(),  # type: ignore[reportArgumentType]
+                    autocomplete=option_name in self._autocompletes,  # type: ignore[reportArgumentType]
                     options=None,
                     choices=choices,
                     locale=self._option_localisations.get(option_name, None),
@@ -264,8 +334,9 @@ class Command:
                 )
             return options
         for name, command in self._sub_commands.items():
+            sub_command_options = command._options
             if command.is_sub_command_group:
-                if not command.options:
+                if not sub_command_options:
                     raise ValueError(f"Subcommand group `{self.name} {command.name}` must have sub commands provided.")
                 options[name] = CommandOption(
                     name=name,
@@ -274,7 +345,7 @@ class Command:
                     native_type=None,
                     required=None,
                     autocomplete=None,
-                    options=command.options,
+                    options=sub_command_options,
                     choices=None,
                 )
                 continue
@@ -285,11 +356,35 @@ class Command:
                 native_type=None,
                 required=None,
                 autocomplete=False,
-                options=command.options,
+                options=sub_command_options,
                 choices=None,
             )
         return options
 
+    @property
+    def option_resolvers(self) -> tuple[tuple[str, int, Any], ...]:
+        """The `(option name, resolver, enum type)` of each option whose value needs converting, built on first use."""
+        if self._option_resolvers is None:
+            option_resolvers: list[tuple[str, int, Any]] = []
+            for option_name, option in (self.options or {}).items():
+                annotation = self._parameters.get(option_name)
+                if annotation.__class__ is types.UnionType:
+                    annotation = get_args(annotation)[0]
+                if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+                    option_resolvers.append((option_name, RESOLVE_ENUM, annotation))
+                elif option._type == ApplicationCommandOptionType.ATTACHMENT:
+                    option_resolvers.append((option_name, RESOLVE_ATTACHMENT, None))
+                elif option._type == ApplicationCommandOptionType.CHANNEL:
+                    option_resolvers.append((option_name, RESOLVE_CHANNEL, None))
+                elif option._type == ApplicationCommandOptionType.ROLE:
+                    option_resolvers.append((option_name, RESOLVE_ROLE, None))
+                elif option._native_type == Member:
+                    option_resolvers.append((option_name, RESOLVE_MEMBER, None))
+                elif option._native_type == User:
+                    option_resolvers.append((option_name, RESOLVE_USER, None))
+            self._option_resolvers = tuple(option_resolvers)
+        return self._option_resolvers
+
     async def invoke(self, interaction: Interaction, **kwargs: Any) -> CommandResponse:
         if self._func is None:
             raise ValueError("This command cannot be directly invoked.")
@@ -297,7 +392,12 @@ class Command:
         return await self._func(interaction, **kwargs)
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        if self._dict is None:
+            self._dict = self._build_dict()
+        return self._dict
+
+    def _build_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
             "name": self.name,
             "type": self.command_type.value,
             "description": self.description,
@@ -307,6 +407,7 @@ class Command:
             "name_localizations": self._locale.name_localisations,
             "description_localizations": self._locale.description_localisations,
         }
+        return drop_nulls(payload)
 
 
 class CommandData:
@@ -317,38 +418,32 @@ class CommandData:
         "interaction",
     )
 
-    def _extract_to_base_command(
-        self,
-        command: Command,
-        options: list[dict[str, Any]],
-    ) -> tuple[Command, list[dict[str, Any]]]:
-        if command.is_sub_command_group and len(options) > 0:
-            for sub_command in command._sub_commands.values():
-                if len(options) == 0:
-                    # For some ungodly reason, despite the `len(options) > 0` check above, this can **still** be empty.
-                    break
-                if sub_command.name == options[0]['name']:
-                    command = sub_command
-                    options = options[0]["options"]
-        return command, options
-
     def __init__(
         self,
         command: Command,
         options: list[dict[str, Any]],
         interaction: Interaction,
     ) -> None:
-        while command.is_sub_command_group:
-            command, options = self._extract_to_base_command(command, options)
+        if command.is_sub_command_group:
+            # The invoked sub command (group) is always the first option, holding the options for the next level down.
+            path: list[str] = []
+            while len(options) > 0 and options[0]["type"] in _SUB_COMMAND_OPTION_TYPES:
+                path.append(options[0]["name"])
+                options = options[0].get("options", [])
+            command = command._leaf_commands.get(tuple(path), command)
 
         self.command: Command = command
-        self.options: dict[str, Any] = {o["name"]: o for o in options}
-        self.options_formatted: dict[str, Any] = {o["name"]: o["value"] for o in options}
+        self.options: dict[str, Any] = {}
+        self.options_formatted: dict[str, Any] = {}
+        for option in options:
+            option_name = option["name"]
+            self.options[option_name] = option
+            self.options_formatted[option_name] = option.get("value")
         self.interaction: Interaction = interaction
 
 
 class AutocompleteResponse:
-    __slotst__: Final[tuple[str, ...]] = ("choices",)
+    __slots__: Final[tuple[str, ...]] = ("choices",)
 
     def __init__(self, choices: list[Choice]) -> None:
         self.choices: list[Choice] = choices
@@ -356,5 +451,5 @@ class AutocompleteResponse:
     def to_dict(self) -> dict[str, Any]:
         return {
             "type": InteractionResponseType.APPLICATION_COMMAND_AUTOCOMPLETE_RESULT,
-            "data": {"choices": [dict(choice) for choice in self.choices][:25]},
+            "data": {"choices": [choice.to_dict() for choice in self.choices[:25]]},
         }
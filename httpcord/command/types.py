@@ -32,12 +32,17 @@ from typing import (
     overload,
 )
 
-from httpcord.attachment import Attachment
-from httpcord.channel import BaseChannel
 from httpcord.enums import ApplicationCommandOptionType
-from httpcord.locale import DEFAULT_LOCALE, Locale
-from httpcord.role import Role
-from httpcord.user import User
+from httpcord.locale import DEFAULT_LOCALE
+from httpcord.utils.functions import drop_nulls
+
+
+if TYPE_CHECKING:
+    from httpcord.attachment import Attachment
+    from httpcord.channel import BaseChannel
+    from httpcord.locale import Locale
+    from httpcord.role import Role
+    from httpcord.user import User
 
 
 __all__: tuple[str, ...] = (
@@ -46,6 +51,15 @@ __all__: tuple[str, ...] = (
 )
 
 
+# Option types which group other options, and so have no `required` flag of their own.
+_SUB_COMMAND_OPTION_TYPES: frozenset[ApplicationCommandOptionType] = frozenset(
+    {
+        ApplicationCommandOptionType.SUB_COMMAND,
+        ApplicationCommandOptionType.SUB_COMMAND_GROUP,
+    }
+)
+
+
 class CommandOption:
     __slots__ = (
         "_name",
@@ -61,6 +75,7 @@ class CommandOption:
         "_min_length",
         "_max_length",
         "_locale",
+        "_dict",
     )
 
     if TYPE_CHECKING:
@@ -262,10 +277,8 @@ class CommandOption:
         self._max_value: int | float | None = max_value
         self._min_length: int | None = min_length
         self._max_length: int | None = max_length
-        self._locale = locale or Locale(
-            name_localisations={DEFAULT_LOCALE: name},
-            description_localisations=({DEFAULT_LOCALE: self._description} if self._description is not None else None),
-        )
+        self._locale: Locale | None = locale
+        self._dict: dict[str, Any] | None = None
 
     @property
     def description(self) -> str:
@@ -273,29 +286,35 @@ class CommandOption:
         return self._description or "--"
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        if self._dict is None:
+            self._dict = self._build_dict()
+        return self._dict
+
+    def _build_dict(self) -> dict[str, Any]:
+        if self._locale is not None:
+            name_localisations = self._locale.name_localisations
+            description_localisations = self._locale.description_localisations
+        else:
+            # Without explicit localisations, the option's own name and description are the default locale's.
+            name_localisations = {DEFAULT_LOCALE: self._name}
+            description_localisations = {DEFAULT_LOCALE: self._description} if self._description is not None else {}
+        payload: dict[str, Any] = {
             "name": self._name,
             "description": self.description,
             "type": self._type.value,
-            "required": (
-                self._required
-                if self._type
-                not in [
-                    ApplicationCommandOptionType.SUB_COMMAND,
-                    ApplicationCommandOptionType.SUB_COMMAND_GROUP,
-                ]
-                else None
-            ),
-            "autocomplete": self._autocomplete,
+            # Both flags default to false on Discord's side, so they are only sent when set.
+            "required": True if self._required and self._type not in _SUB_COMMAND_OPTION_TYPES else None,
+            "autocomplete": True if self._autocomplete else None,
             "options": [option.to_dict() for option in self._options.values()] if self._options else None,
             "choices": [choice.to_dict() for choice in self._choices] if self._choices else None,
             "min_value": self._min_value,
             "max_value": self._max_value,
             "min_length": self._min_length,
             "max_length": self._max_length,
-            "name_localizations": self._locale.name_localisations,
-            "description_localizations": self._locale.description_localisations,
+            "name_localizations": name_localisations,
+            "description_localizations": description_localisations,
         }
+        return drop_nulls(payload)
 
     def __iter__(self) -> Iterator[tuple[str, Any]]:
         yield from self.to_dict().items()
@@ -305,17 +324,19 @@ class Choice:
     __slots__ = (
         "_name",
         "_value",
+        "_dict",
     )
 
     def __init__(self, name: str, value: str) -> None:
         self._name: str = name
         self._value: str = value
+        self._dict: dict[str, Any] = {
+            "name": name,
+            "value": value,
+        }
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "name": self._name,
-            "value": self._value,
-        }
+        return self._dict
 
     def __iter__(self) -> Iterator[tuple[str, Any]]:
         yield from self.to_dict().items()
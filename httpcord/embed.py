@@ -24,6 +24,8 @@ SOFTWARE.
 
 from typing import Any, Final
 
+from httpcord.utils.functions import drop_nulls
+
 
 __all__: Final[tuple[str, ...]] = ("Embed",)
 
@@ -50,32 +52,6 @@ class EmbedFooter:
         }
 
 
-class EmbedField:
-    __slots__: Final[tuple[str, ...]] = (
-        "name",
-        "value",
-        "inline",
-    )
-
-    def __init__(
-        self,
-        *,
-        name: str | None = None,
-        value: str | None = None,
-        inline: bool = False,
-    ) -> None:
-        self.name = name
-        self.value = value
-        self.inline = inline
-
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "name": self.name,
-            "value": self.value,
-            "inline": self.inline,
-        }
-
-
 class Embed:
     __slots__: Final[tuple[str, ...]] = (
         "title",
@@ -95,7 +71,8 @@ class Embed:
         self.title = title
         self.description = description
         self.colour = colour
-        self._fields: list[EmbedField] = []
+        # Fields are stored in their serialised form, as they are never read back.
+        self._fields: list[dict[str, Any]] = []
         self._footer: EmbedFooter | None = None
 
     def add_field(
@@ -106,11 +83,11 @@ class Embed:
         inline: bool = False,
     ) -> None:
         self._fields.append(
-            EmbedField(
-                name=name,
-                value=value,
-                inline=inline,
-            )
+            {
+                "name": name,
+                "value": value,
+                "inline": inline,
+            }
         )
 
     def set_footer(
@@ -125,10 +102,11 @@ class Embed:
         )
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        payload: dict[str, Any] = {
             "title": self.title,
             "description": self.description,
             "color": self.colour,
-            "footer": ({} if not self._footer else self._footer.to_dict()),
-            "fields": [f.to_dict() for f in self._fields],
+            "footer": self._footer.to_dict() if self._footer else None,
+            "fields": list(self._fields),
         }
+        return drop_nulls(payload)
@@ -22,8 +22,11 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
 import io
+import mimetypes
 import os
+from collections.abc import AsyncIterable
 
 
 __all__: tuple[str, ...] = ("File",)
@@ -36,17 +39,22 @@ class File:
         "_spoiler",
         "_fp",
         "_data",
+        "_streamed",
     )
 
     def __init__(
         self,
-        fp: os.PathLike | io.BufferedIOBase,
+        fp: os.PathLike | io.BufferedIOBase | AsyncIterable[bytes] | bytes | bytearray | memoryview,
         filename: str,
         description: str | None = None,
         spoiler: bool = False,
     ) -> None:
+        if not isinstance(fp, (os.PathLike, io.BufferedIOBase, AsyncIterable, bytes, bytearray, memoryview)):
+            raise TypeError("File pointer must be a PathLike, BufferedIOBase, AsyncIterable or bytes-like instance.")
+
         self._data: bytes | None = None
-        self._fp: os.PathLike | io.BufferedIOBase = fp
+        self._fp: os.PathLike | io.BufferedIOBase | AsyncIterable[bytes] | bytes | bytearray | memoryview = fp
+        self._streamed: bool = False
         self._filename: str = filename
         self._description: str | None = description
         self._spoiler: bool = spoiler
@@ -66,16 +74,64 @@ class File:
         """Whether the file is a spoiler."""
         return self._spoiler
 
+    @property
+    def content_type(self) -> str:
+        """The MIME type of the file, guessed from its filename."""
+        return mimetypes.guess_type(self._filename)[0] or "application/octet-stream"
+
+    def payload(self) -> bytes | bytearray | memoryview | io.BufferedIOBase | AsyncIterable[bytes]:
+        """The file's content in the form it should be written into a multipart body.
+
+        Files on disk are opened rather than read, so their content is read in chunks
+        off the event loop while the request is being sent. In-memory buffers are passed
+        through as-is. Open file objects are read once and their content kept, as sending
+        consumes them, which blocks; use `async_payload` from a coroutine. Streamed content
+        can only be sent once.
+        """
+        if isinstance(self._fp, (bytes, bytearray, memoryview)):
+            return self._fp
+        if self._data is not None:
+            return self._data
+        if isinstance(self._fp, os.PathLike):
+            return open(self._fp, "rb")
+        if isinstance(self._fp, io.BufferedIOBase):
+            return self.read()
+        if self._streamed:
+            raise RuntimeError("Streamed file content has already been sent and cannot be sent again.")
+        self._streamed = True
+        return self._fp
+
+    async def async_payload(self) -> bytes | bytearray | memoryview | io.BufferedIOBase | AsyncIterable[bytes]:
+        """The file's content as returned by `payload`, with open file objects read in a worker thread."""
+        if self._data is None and isinstance(self._fp, io.BufferedIOBase):
+            await self.async_read()
+        return self.payload()
+
     def read(self) -> bytes:
         """Read the file's content."""
         if self._data is not None:
             return self._data
         if isinstance(self._fp, os.PathLike):
-            with open(self._fp, "rb") as f:
-                self._data = f.read()
+            # Unbuffered, so the whole file is read in one pass sized from its stat rather than through a buffer.
+            with open(self._fp, "rb", buffering=0) as f:
+                self._data = f.readall()
                 return self._data
         elif isinstance(self._fp, io.BufferedIOBase):
             self._data = self._fp.read()
             return self._data
+        elif isinstance(self._fp, (bytes, bytearray, memoryview)):
+            self._data = bytes(self._fp)
+            return self._data
         else:
-            raise TypeError("File pointer must be a PathLike or BufferedIOBase instance.")
+            raise TypeError("Streamed file content can only be read with `async_read`.")
+
+    async def async_read(self) -> bytes:
+        """Read the file's content, doing blocking reads in a worker thread."""
+        if self._data is not None:
+            return self._data
+        if isinstance(self._fp, (os.PathLike, io.BufferedIOBase)):
+            return await asyncio.to_thread(self.read)
+        if isinstance(self._fp, AsyncIterable):
+            self._data = b"".join([chunk async for chunk in self._fp])
+            return self._data
+        return self.read()
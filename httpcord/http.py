@@ -22,8 +22,11 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-import json
+from __future__ import annotations
+
+import asyncio
 import logging
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -32,20 +35,32 @@ from typing import (
     overload,
 )
 
-from aiohttp import ClientSession
+import orjson
+from aiohttp import (
+    ClientSession,
+    ClientTimeout,
+    DummyCookieJar,
+    FormData,
+    TCPConnector,
+)
 from aiohttp.client_exceptions import ClientError
 
 from httpcord.file import File
 
 
+_LOG: Final[logging.Logger] = logging.getLogger("httpcord")
+
+
 class Route:
     DISCORD_API_BASE: Final[str] = "https://discord.com/api/v10"
 
     __slots__: Final[tuple[str, ...]] = (
         "_url",
+        "_full_url",
         "_headers",
         "_json",
         "_files",
+        "_form",
     )
 
     def __init__(
@@ -57,31 +72,31 @@ class Route:
         files: list[File] | None = None,
     ) -> None:
         self._url = url
+        self._full_url = Route.DISCORD_API_BASE + url
         self._headers = headers or {}
         self._json = json
         self._files = files or []
+        self._form: FormData | None = None
 
     @property
     def content_type(self) -> str:
         """The content type of the route."""
-        if self.json is not None:
+        if self._json is not None and len(self._files) == 0:
             return "application/json"
         return "multipart/form-data"
 
     @property
     def url(self) -> str:
         """The URL of the route."""
-        return Route.DISCORD_API_BASE + self._url
+        return self._full_url
 
     @property
     def headers(self) -> dict[str, Any]:
         """The headers of the route."""
-        _headers = self._headers.copy()
-
         # FIX: I have no idea why, but whenever we send a multipart/form-data request,
         # Discord ignores the payload_json key in form data.
         # _headers["Content-Type"] = self.content_type
-        return _headers
+        return self._headers
 
     @property
     def json(self) -> dict | None:
@@ -91,36 +106,116 @@ class Route:
         return self._json
 
     @property
-    def data(self) -> dict | None:
-        """The data to send with the route."""
+    def data(self) -> FormData | None:
+        """The data to send with the route, once built by `build_data`."""
+        return self._form
 
+    async def build_data(self) -> FormData | None:
+        """Build the data to send with the route, only once as file payloads may only be opened once."""
         if len(self._files) == 0:
             return None
+        if self._form is not None:
+            return self._form
 
-        data: dict = {}
+        data = FormData()
         for idx, file in enumerate(self._files):
-            data[f"files[{idx}]"] = file.read()
+            data.add_field(
+                f"files[{idx}]",
+                await file.async_payload(),
+                filename=file.filename,
+                content_type=file.content_type,
+            )
 
         if self._json is not None:
-            data["payload_json"] = json.dumps(self._json)
+            data.add_field("payload_json", orjson.dumps(self._json).decode(), content_type="application/json")
 
+        self._form = data
         return data
 
 
+"""Hosts the bot talks to, resolved ahead of time so the first requests to them skip the DNS lookup."""
+DISCORD_HOSTS: Final[tuple[str, ...]] = (
+    "discord.com",
+    "cdn.discordapp.com",
+)
+
+
 class HTTP:
+    """Outbound Discord API client. One keep-alive session is shared for the lifetime of the bot."""
+
     __slots__: Final[tuple[str, ...]] = (
         "_token",
         "_session",
+        "_closed",
         "_headers",
     )
 
     def __init__(self, token: str) -> None:
         self._token = token
-        self._session = ClientSession()
-        self._headers: dict[str, str] = {
-            "Authorization": f"Bot {self._token}",
-            "User-Agent": "HTTPCord / Python - https://git.uwu.gal/pyhttpcord",
-        }
+        self._session: ClientSession | None = None
+        self._closed: bool = False
+        # Read-only, as the defaults are shared by every request and only ever merged into a new dict.
+        self._headers: MappingProxyType[str, str] = MappingProxyType(
+            {
+                "Authorization": f"Bot {self._token}",
+                "User-Agent": "HTTPCord / Python - https://git.uwu.gal/pyhttpcord",
+            }
+        )
+
+    async def __aenter__(self) -> HTTP:
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> ClientSession:
+        """The client session shared by every request made for the bot, created on first use."""
+        if self._closed:
+            raise RuntimeError("The HTTP client has been closed")
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                # Most requests go to discord.com, so a single host may use a large share of the pool. The total
+                # stays capped, as the public session is also used for downloads from the CDN and other hosts.
+                # Idle connections are kept around for longer than Discord's own idle timeout.
+                connector=TCPConnector(
+                    limit=100,
+                    limit_per_host=32,
+                    keepalive_timeout=120,
+                    use_dns_cache=True,
+                    ttl_dns_cache=600,
+                ),
+                # Bounded per phase rather than in total, so a hung connection fails without cutting off slow uploads.
+                timeout=ClientTimeout(total=None, sock_connect=10, sock_read=30),
+                cookie_jar=DummyCookieJar(),
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            )
+        return self._session
+
+    async def resolve_hosts(self) -> None:
+        """Warm the connector's DNS cache for Discord's hosts. Resolution failures are ignored."""
+        connector = self.session.connector
+        if not isinstance(connector, TCPConnector):
+            return
+        # The connector has no public way to resolve ahead of time. Its private resolver is used, so any
+        # failure, including that method changing between aiohttp versions, only skips the warm up.
+        try:
+            await asyncio.gather(
+                *(connector._resolve_host(host, 443) for host in DISCORD_HOSTS),  # pyright: ignore[reportPrivateUsage]
+                return_exceptions=True,
+            )
+        except Exception:
+            _LOG.warning("Could not warm the DNS cache for Discord's hosts", exc_info=True)
+
+    async def close(self) -> None:
+        """Close the client session and its pooled connections, if it was ever opened.
+
+        The client can't be used again afterwards.
+        """
+        self._closed = True
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     if TYPE_CHECKING:
 
@@ -142,68 +237,38 @@ class HTTP:
         @overload
         async def patch(self, route: Route, expect_return: Literal[False] = ...) -> None: ...
 
-    async def post(self, route: Route, expect_return: bool = True) -> dict[str, Any] | None:
+    async def _request(self, method: str, route: Route, expect_return: bool) -> dict[str, Any] | None:
         try:
-            headers = self._headers
-            headers.update(route.headers)
-            resp = await self._session.post(
+            # Merged into a new dict, so one route's headers never leak into the next request.
+            headers = {**self._headers, **route.headers}
+            data = await route.build_data()
+            async with self.session.request(
+                method,
                 url=route.url,
                 json=route.json,
-                data=route.data,
+                data=data,
                 headers=headers,
-            )
-            if expect_return:
-                json = await resp.json()
-                logging.getLogger("httpcord").debug(f"POST {route.url} returned {json}")
-                return json
-
-            if logging.getLogger("httpcord").isEnabledFor(logging.DEBUG):
-                logging.getLogger("httpcord").debug(f"POST {route.url} returned {await resp.json()}")
+            ) as resp:
+                if expect_return:
+                    json = await resp.json(loads=orjson.loads)
+                    _LOG.debug("%s %s returned %s", method, route.url, json)
+                    return json
+
+                # The body is drained even when unused, as a connection with unread data is closed
+                # on release instead of going back to the pool. It is logged as text, never parsed.
+                body = await resp.read()
+                if _LOG.isEnabledFor(logging.DEBUG):
+                    _LOG.debug("%s %s returned %s", method, route.url, body.decode())
         except ClientError as e:
-            raise RuntimeError(f"POST request failed: {e}")
+            raise RuntimeError(f"{method} request failed: {e}")
         except Exception as e:
-            raise RuntimeError(f"Unexpected error in POST: {e}")
+            raise RuntimeError(f"Unexpected error in {method}: {e}")
 
-    async def put(self, route: Route, expect_return: bool = True) -> dict[str, Any] | None:
-        try:
-            headers = self._headers
-            headers.update(route.headers)
-            resp = await self._session.put(
-                url=route.url,
-                json=route.json,
-                data=route.data,
-                headers=headers,
-            )
-            if expect_return:
-                json = await resp.json()
-                logging.getLogger("httpcord").debug(f"PUT {route.url} returned {json}")
-                return json
+    async def post(self, route: Route, expect_return: bool = True) -> dict[str, Any] | None:
+        return await self._request("POST", route, expect_return)
 
-            if logging.getLogger("httpcord").isEnabledFor(logging.DEBUG):
-                logging.getLogger("httpcord").debug(f"PUT {route.url} returned {await resp.json()}")
-        except ClientError as e:
-            raise RuntimeError(f"PUT request failed: {e}")
-        except Exception as e:
-            raise RuntimeError(f"Unexpected error in PUT: {e}")
+    async def put(self, route: Route, expect_return: bool = True) -> dict[str, Any] | None:
+        return await self._request("PUT", route, expect_return)
 
     async def patch(self, route: Route, expect_return: bool = True) -> dict[str, Any] | None:
-        try:
-            headers = self._headers
-            headers.update(route.headers)
-            resp = await self._session.patch(
-                url=route.url,
-                json=route.json,
-                data=route.data,
-                headers=headers,
-            )
-            if expect_return:
-                json = await resp.json()
-                logging.getLogger("httpcord").debug(f"PATCH {route.url} returned {json}")
-                return json
-
-            if logging.getLogger("httpcord").isEnabledFor(logging.DEBUG):
-                logging.getLogger("httpcord").debug(f"PATCH {route.url} returned {await resp.json()}")
-        except ClientError as e:
-            raise RuntimeError(f"PATCH request failed: {e}")
-        except Exception as e:
-            raise RuntimeError(f"Unexpected error in PATCH: {e}")
+        return await self._request("PATCH", route, expect_return)
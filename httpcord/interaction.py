@@ -30,6 +30,7 @@ from typing import (
     Final,
 )
 
+import orjson
 from fastapi import Request
 
 from httpcord.channel import BaseChannel, Channel
@@ -52,6 +53,8 @@ __all__: Final[tuple[str, ...]] = ("Interaction",)
 
 class Resolved:
     __slots__: tuple[str, ...] = (
+        "_data",
+        "_guild_id",
         "_users",
         "_members",
         "_channels",
@@ -60,45 +63,53 @@ class Resolved:
     )
 
     def __init__(self, data: dict[str, Any]) -> None:
-        resolved = data["data"].get("resolved", {})
-        guild_id = int(data["guild_id"]) if "guild_id" in data else None
-        self._users: dict[int, User] = {int(k): User(v) for k, v in resolved.get("users", {}).items()}
-        for user_id in resolved.get("members", {}).keys():
-            resolved["members"][str(user_id)]["user"] = resolved["users"][str(user_id)]
-        self._members: dict[int, Member] = {
-            int(k): Member(v, guild_id or 0) for k, v in resolved.get("members", {}).items()
-        }
-        self._channels: dict[int, Channel] = {
-            int(k): BaseChannel.from_data(v) for k, v in resolved.get("channels", {}).items()
-        }
-        self._roles: dict[int, Role] = {int(k): Role(v) for k, v in resolved.get("roles", {}).items()}
-        self._messages: dict[int, PartialMessage] = {
-            int(k): PartialMessage(v) for k, v in resolved.get("messages", {}).items()
-        }
+        # Each collection is only built the first time it is read, as most interactions use few or none of them.
+        self._data: dict[str, Any] = data["data"].get("resolved", {})
+        self._guild_id: int | None = int(data["guild_id"]) if "guild_id" in data else None
+        self._users: dict[int, User] | None = None
+        self._members: dict[int, Member] | None = None
+        self._channels: dict[int, Channel] | None = None
+        self._roles: dict[int, Role] | None = None
+        self._messages: dict[int, PartialMessage] | None = None
 
     @property
     def users(self) -> dict[int, User]:
         """A dictionary of resolved users."""
+        if self._users is None:
+            self._users = {int(k): User(v) for k, v in self._data.get("users", {}).items()}
         return self._users
 
     @property
     def members(self) -> dict[int, Member]:
         """A dictionary of resolved members."""
+        if self._members is None:
+            # Discord sends each member's user separately, so it is joined back on without modifying the payload.
+            users = self._data.get("users", {})
+            self._members = {
+                int(k): Member({**v, "user": users[k]}, self._guild_id or 0)
+                for k, v in self._data.get("members", {}).items()
+            }
         return self._members
 
     @property
     def channels(self) -> dict[int, Channel]:
         """A dictionary of resolved channels."""
+        if self._channels is None:
+            self._channels = {int(k): BaseChannel.from_data(v) for k, v in self._data.get("channels", {}).items()}
         return self._channels
 
     @property
     def roles(self) -> dict[int, Role]:
         """A dictionary of resolved roles."""
+        if self._roles is None:
+            self._roles = {int(k): Role(v) for k, v in self._data.get("roles", {}).items()}
         return self._roles
 
     @property
     def messages(self) -> dict[int, PartialMessage]:
         """A dictionary of resolved messages."""
+        if self._messages is None:
+            self._messages = {int(k): PartialMessage(v) for k, v in self._data.get("messages", {}).items()}
         return self._messages
 
 
@@ -114,6 +125,7 @@ class Interaction[HTTPBotClient: HTTPBot = HTTPBot]:
         "_bot",
         "_token",
         "_channel",
+        "_channel_obj",
         "_guild_id",
         "_resolved",
     )
@@ -130,10 +142,11 @@ class Interaction[HTTPBotClient: HTTPBot = HTTPBot]:
         self._id = int(data["id"])
         self._token: str = data["token"]
         self._channel = self._data["channel"]
-        self._guild_id: str | None = data.get("guild_id")
+        self._channel_obj: Channel | None = None
+        self._guild_id: int | None = int(data["guild_id"]) if "guild_id" in data else None
         if data.get("member", None) is not None:
             assert self._guild_id is not None, "Guild ID must be present if member data is provided."
-            self._member = Member(data["member"], int(self._guild_id))
+            self._member = Member(data["member"], self._guild_id)
             self._user = User(data["member"]["user"])
         else:
             self._user = User(data["user"])
@@ -145,12 +158,12 @@ class Interaction[HTTPBotClient: HTTPBot = HTTPBot]:
     @property
     def id(self) -> int:
         """The interaction ID."""
-        return int(self._id)
+        return self._id
 
     @property
     def guild_id(self) -> int | None:
         """The ID of the guild the interaction was sent in, if applicable."""
-        return int(self._guild_id) if self._guild_id is not None else None
+        return self._guild_id
 
     @property
     def user(self) -> User:
@@ -165,7 +178,9 @@ class Interaction[HTTPBotClient: HTTPBot = HTTPBot]:
     @property
     def channel(self) -> Channel:
         """The channel the interaction was sent in."""
-        return BaseChannel.from_data(self._channel)
+        if self._channel_obj is None:
+            self._channel_obj = BaseChannel.from_data(self._channel)
+        return self._channel_obj
 
     @property
     def token(self) -> str:
@@ -240,10 +255,13 @@ class Interaction[HTTPBotClient: HTTPBot = HTTPBot]:
 class CommandResponse:
     __slots__: Final[tuple[str, ...]] = (
         "_type",
+        "_type_value",
         "_content",
         "_embeds",
         "_flags",
         "_files",
+        "_dict",
+        "_encoded",
     )
 
     def __init__(
@@ -256,10 +274,13 @@ class CommandResponse:
         files: list[File] | None = None,
     ) -> None:
         self._type: InteractionResponseType = type
+        self._type_value: int = type.value
         self._content: str | None = content
         self._embeds: list[Embed] = embeds or []
         self._flags = InteractionResponseFlags.EPHEMERAL if ephemeral else None
         self._files: list[File] = files or []
+        self._dict: dict[str, Any] | None = None
+        self._encoded: bytes | None = None
 
     @property
     def files(self) -> list[File]:
@@ -292,12 +313,13 @@ class CommandResponse:
         return self._flags
 
     def to_dict(self) -> dict[str, Any]:
+        if self._dict is None:
+            self._dict = self._build_dict()
+        # The embed and file lists can still be changed after the response is built, so only the rest is kept.
         return {
-            "type": self.type,
+            "type": self._type_value,
             "data": {
-                "flags": self.flags,
-                "content": self.content,
-                "embeds": [e.to_dict() for e in self.embeds],
+                **self._dict,
                 "attachments": [
                     {
                         "id": idx,
@@ -305,7 +327,22 @@ class CommandResponse:
                         "description": file.description,
                         "spoiler": file.spoiler,
                     }
-                    for idx, file in enumerate(self.files)
+                    for idx, file in enumerate(self._files)
                 ],
+                "embeds": [e.to_dict() for e in self._embeds],
             },
         }
+
+    def _build_dict(self) -> dict[str, Any]:
+        return {
+            "flags": self._flags,
+            "content": self._content,
+        }
+
+    def to_bytes(self) -> bytes:
+        """The response encoded as JSON, serialised only once however often it is returned without embeds or files."""
+        if self._embeds or self._files:
+            return orjson.dumps(self.to_dict())
+        if self._encoded is None:
+            self._encoded = orjson.dumps(self.to_dict())
+        return self._encoded
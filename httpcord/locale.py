@@ -140,18 +140,11 @@ class Locale:
             "description_localisations",
         ],
     ) -> str:
-        if key == "name_localisations":
-            value = self.name_localisations.get(DEFAULT_LOCALE)
-            if value is None:
-                return list(self.name_localisations.values())[0]
-            return value
-        elif key == "description_localisations":
-            value = self.description_localisations.get(DEFAULT_LOCALE)
-            if value is None:
-                return list(self.description_localisations.values())[0]
-            return value
-        else:
-            raise KeyError(key)
+        localisations = self[key]
+        value = localisations.get(DEFAULT_LOCALE)
+        if value is None:
+            return next(iter(localisations.values()))
+        return value
 
     def __getitem__(
         self,
@@ -160,12 +153,10 @@ class Locale:
             "description_localisations",
         ],
     ) -> LocaleDict:
-        if key == "name_localisations":
-            return self.name_localisations
-        elif key == "description_localisations":
-            return self.description_localisations
-        else:
+        # The keys are exactly the slot names, so the lookup is a plain attribute read.
+        if key not in self.__slots__:
             raise KeyError(key)
+        return getattr(self, key)
 
     def to_dict(self) -> dict[Literal["name_localisations", "description_localisations"], LocaleDict]:
         return {
@@ -44,15 +44,17 @@ class PartialMessage:
 
     def __init__(self, data: dict) -> None:
         self._id: int = int(data["id"])
-        self._lobby_id: str | None = data.get("lobby_id")
+        self._lobby_id: int | None = int(data["lobby_id"]) if data.get("lobby_id") is not None else None
         self._channel_id: int = int(data["channel_id"])
         self._type: int | None = data.get("type")
         self._content: str = data["content"]
         self._author: dict = data["author"]
         self._flags: int | None = data.get("flags")
-        self._application_id: str | None = data.get("application_id")
+        self._application_id: int | None = (
+            int(data["application_id"]) if data.get("application_id") is not None else None
+        )
         self._channel: dict | None = data.get("channel")
-        self._recipient_id: str | None = data.get("recipient_id")
+        self._recipient_id: int | None = int(data["recipient_id"]) if data.get("recipient_id") is not None else None
 
     @property
     def id(self) -> int:
@@ -62,7 +64,7 @@ class PartialMessage:
     @property
     def lobby_id(self) -> int | None:
         """The ID of the lobby this message belongs to, if applicable."""
-        return int(self._lobby_id) if self._lobby_id is not None else None
+        return self._lobby_id
 
     @property
     def channel_id(self) -> int:
@@ -92,7 +94,7 @@ class PartialMessage:
     @property
     def application_id(self) -> int | None:
         """The ID of the application associated with the message, if applicable."""
-        return int(self._application_id) if self._application_id is not None else None
+        return self._application_id
 
     @property
     def channel(self) -> BaseChannel | None:
@@ -102,4 +104,4 @@ class PartialMessage:
     @property
     def recipient_id(self) -> int | None:
         """The ID of the recipient of the message, if applicable."""
-        return int(self._recipient_id) if self._recipient_id is not None else None
+        return self._recipient_id
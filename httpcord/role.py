@@ -22,8 +22,9 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from typing import Final
+
 from httpcord.asset import Asset
-from httpcord.utils.functions import null_type_to_bool
 
 
 __all__: tuple[str, ...] = ("Role",)
@@ -37,9 +38,10 @@ class RoleColours:
     )
 
     def __init__(self, data: dict) -> None:
-        self._primary_colour: int = int(data["primary_color"])
-        self._secondary_colour: int | None = int(data["secondary_color"])
-        self._tertiary_colour: int | None = int(data["tertiary_color"])
+        # Colours are JSON numbers, so they are stored as decoded.
+        self._primary_colour: int = data["primary_color"]
+        self._secondary_colour: int | None = data.get("secondary_color")
+        self._tertiary_colour: int | None = data.get("tertiary_color")
 
     @property
     def primary_colour(self) -> int:
@@ -68,12 +70,15 @@ class RoleTags:
     )
 
     def __init__(self, data: dict) -> None:
-        self._bot_id: int | None = int(data.get("bot_id", 0))
+        self._bot_id: int | None = int(data["bot_id"]) if data.get("bot_id") is not None else None
         self._integration_id: int | None = data.get("integration_id")
-        self._subscription_listing_id: int | None = int(data.get("subscription_listing_id", 0))
-        self._premium_subscriber: bool = null_type_to_bool(data, "premium_subscriber")
-        self._available_for_purchase: bool = null_type_to_bool(data, "available_for_purchase")
-        self._guild_connections: bool = null_type_to_bool(data, "guild_connections")
+        self._subscription_listing_id: int | None = (
+            int(data["subscription_listing_id"]) if data.get("subscription_listing_id") is not None else None
+        )
+        # Null-typed tags are true when present at all, see `null_type_to_bool`. Tested inline to skip three calls.
+        self._premium_subscriber: bool = "premium_subscriber" in data
+        self._available_for_purchase: bool = "available_for_purchase" in data
+        self._guild_connections: bool = "guild_connections" in data
 
     @property
     def bot_id(self) -> int | None:
@@ -101,6 +106,10 @@ class RoleTags:
         return self._available_for_purchase
 
 
+"""Shared by every role without tags, as RoleTags is never modified after it is built."""
+_EMPTY_ROLE_TAGS: Final[RoleTags] = RoleTags({})
+
+
 class Role:
     __slots__: tuple[str, ...] = (
         "_id",
@@ -117,23 +126,26 @@ class Role:
         "_mentionable",
         "_flags",
         "_tags",
+        "_icon_obj",
     )
 
     def __init__(self, data: dict) -> None:
         self._id: int = int(data["id"])
         self._name: str = data["name"]
         self._description: str | None = data.get("description")
-        self._colour: int = int(data["color"])
-        self._colours: dict | None = data.get("colours")
+        self._colour: int = data["color"]
+        self._colours: RoleColours | None = RoleColours(colours) if (colours := data.get("colours")) else None
         self._hoist: bool = data["hoist"]
         self._icon: str | None = data.get("icon")
         self._unicode_emoji: str | None = data.get("unicode_emoji")
-        self._position: int = int(data["position"])
+        self._position: int = data["position"]
+        # Permissions are a bitfield sent as a string, unlike colour and position which are JSON numbers.
         self._permissions: int = int(data["permissions"])
         self._managed: bool = data["managed"]
         self._mentionable: bool = data["mentionable"]
         self._flags: int | None = data.get("flags")
-        self._tags: dict | None = data.get("tags")
+        self._tags: RoleTags = RoleTags(tags) if (tags := data.get("tags")) else _EMPTY_ROLE_TAGS
+        self._icon_obj: Asset | None = None
 
     @property
     def id(self) -> int:
@@ -158,9 +170,7 @@ class Role:
     @property
     def colours(self) -> RoleColours | None:
         """The role colours, if any."""
-        if self._colours is not None:
-            return RoleColours(self._colours)
-        return None
+        return self._colours
 
     @property
     def hoist(self) -> bool:
@@ -170,12 +180,12 @@ class Role:
     @property
     def icon(self) -> Asset | None:
         """The icon of the role, if any."""
-        if self._icon is not None:
-            return Asset(
+        if self._icon is not None and self._icon_obj is None:
+            self._icon_obj = Asset(
                 base_url=f"https://cdn.discordapp.com/role-icons/{self.id}/{self._icon}",
                 code=self._icon,
             )
-        return None
+        return self._icon_obj
 
     @property
     def unicode_emoji(self) -> str | None:
@@ -210,4 +220,4 @@ class Role:
     @property
     def tags(self) -> RoleTags:
         """The tags of the role, if any."""
-        return RoleTags(self._tags) if self._tags is not None else RoleTags({})
+        return self._tags
@@ -24,8 +24,13 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Final, TypedDict
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import (
+    Any,
+    Final,
+    TypedDict,
+)
 
 from httpcord.attachment import Attachment
 from httpcord.channel import BaseChannel
@@ -48,55 +53,81 @@ __all__: Final[tuple[str, ...]] = (
 )
 
 
-@dataclass(slots=True)
-class Integer:
+def _validate_bounds(lower: float | None, upper: float | None, lower_name: str, upper_name: str) -> None:
+    if lower is not None and upper is not None and lower > upper:
+        raise ValueError(f"{lower_name} cannot be greater than {upper_name}")
+
+
+"""The shared unconstrained instance of each constraint class, created on first use."""
+_UNCONSTRAINED: dict[type, Any] = {}
+
+
+class _Constraint:
+    """Base for the option constraint dataclasses, handing out one shared instance when no bounds are given."""
+
+    __slots__: tuple[str, ...] = ()
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+        if any(arg is not None for arg in args) or any(arg is not None for arg in kwargs.values()):
+            return object.__new__(cls)
+        instance = _UNCONSTRAINED.get(cls)
+        if instance is None:
+            instance = _UNCONSTRAINED[cls] = object.__new__(cls)
+        return instance
+
+    def __reduce__(self) -> tuple[type, tuple[Any, ...]]:
+        # Rebuilt through the constructor, as copy and pickle would otherwise restore state onto the shared instance.
+        return self.__class__, tuple(getattr(self, field.name) for field in fields(self))  # type: ignore[arg-type]
+
+
+@dataclass(slots=True, frozen=True)
+class Integer(_Constraint):
     """Dataclass for integer constraints, with validation to ensure min_value <= max_value if both are provided."""
 
     min_value: int | None = None
     max_value: int | None = None
 
     def __post_init__(self):
-        if self.min_value is not None and self.max_value is not None and self.min_value > self.max_value:
-            raise ValueError("min_value cannot be greater than max_value")
+        _validate_bounds(self.min_value, self.max_value, "min_value", "max_value")
 
 
-@dataclass(slots=True)
-class Float:
+@dataclass(slots=True, frozen=True)
+class Float(_Constraint):
     """Dataclass for float constraints, with validation to ensure min_value <= max_value if both are provided."""
 
     min_value: float | None = None
     max_value: float | None = None
 
     def __post_init__(self):
-        if self.min_value is not None and self.max_value is not None and self.min_value > self.max_value:
-            raise ValueError("min_value cannot be greater than max_value")
+        _validate_bounds(self.min_value, self.max_value, "min_value", "max_value")
 
 
-@dataclass(slots=True)
-class String:
+@dataclass(slots=True, frozen=True)
+class String(_Constraint):
     """Dataclass for string constraints, with validation to ensure min_length <= max_length if both are provided."""
 
     min_length: int | None = None
     max_length: int | None = None
 
     def __post_init__(self):
-        if self.min_length is not None and self.max_length is not None and self.min_length > self.max_length:
-            raise ValueError("min_length cannot be greater than max_length")
+        _validate_bounds(self.min_length, self.max_length, "min_length", "max_length")
 
 
 """Dictionary mapping Python types to Discord application command option types for consistent type handling."""
-TYPE_CONVERSION_TABLE: dict[type, ApplicationCommandOptionType] = {
-    bool: ApplicationCommandOptionType.BOOLEAN,
-    int: ApplicationCommandOptionType.INTEGER,
-    float: ApplicationCommandOptionType.NUMBER,
-    str: ApplicationCommandOptionType.STRING,
-    User: ApplicationCommandOptionType.USER,
-    Member: ApplicationCommandOptionType.USER,
-    Attachment: ApplicationCommandOptionType.ATTACHMENT,
-    BaseChannel: ApplicationCommandOptionType.CHANNEL,
-    # mentionable: ApplicationCommandOptionType.MENTIONABLE,
-    Role: ApplicationCommandOptionType.ROLE,
-}
+TYPE_CONVERSION_TABLE: Final[MappingProxyType[type, ApplicationCommandOptionType]] = MappingProxyType(
+    {
+        bool: ApplicationCommandOptionType.BOOLEAN,
+        int: ApplicationCommandOptionType.INTEGER,
+        float: ApplicationCommandOptionType.NUMBER,
+        str: ApplicationCommandOptionType.STRING,
+        User: ApplicationCommandOptionType.USER,
+        Member: ApplicationCommandOptionType.USER,
+        Attachment: ApplicationCommandOptionType.ATTACHMENT,
+        BaseChannel: ApplicationCommandOptionType.CHANNEL,
+        # mentionable: ApplicationCommandOptionType.MENTIONABLE,
+        Role: ApplicationCommandOptionType.ROLE,
+    }
+)
 
 
 class JSONResponseError(TypedDict):
@@ -23,6 +23,7 @@ SOFTWARE.
 """
 
 import datetime
+import sys
 from typing import Final
 
 from httpcord.asset import Asset
@@ -32,6 +33,16 @@ from httpcord.avatar import NUMBER_OF_DEFAULT_AVATARS, AvatarDecoration
 __all__: tuple[str, ...] = ("User",)
 
 
+"""UTC, bound once as nameplate expiry times are converted whenever a user with a nameplate is built."""
+_UTC: Final[datetime.timezone] = datetime.timezone.utc
+
+"""The default avatars, one shared Asset each, as every user without an avatar maps to one of these."""
+_DEFAULT_AVATARS: Final[tuple[Asset, ...]] = tuple(
+    Asset("https://cdn.discordapp.com/embed/avatars", str(avatar_id))
+    for avatar_id in range(NUMBER_OF_DEFAULT_AVATARS)
+)
+
+
 class Nameplate:
     __slots__: Final[tuple[str, ...]] = (
         "_expires_at",
@@ -39,26 +50,30 @@ class Nameplate:
         "_pallet",
         "_label",
         "_sku_id",
+        "_asset_obj",
     )
 
     def __init__(self, data: dict) -> None:
+        expires_at: int | str | None = data["expires_at"]
         self._expires_at: datetime.datetime | None = (
-            datetime.datetime.fromtimestamp(int(data["expires_at"]), tz=datetime.timezone.utc)
-            if data["expires_at"] is not None
-            else None
+            datetime.datetime.fromtimestamp(int(expires_at), tz=_UTC) if expires_at is not None else None
         )
         self._asset = data["asset"]
-        self._pallet: str = data["pallet"]
-        self._label: str = data["label"]
+        # Pallets and labels come from a small set of values, so share a single string per value.
+        self._pallet: str = sys.intern(data["pallet"])
+        self._label: str = sys.intern(data["label"])
         self._sku_id: int = int(data["sku_id"])
+        self._asset_obj: Asset | None = None
 
     @property
     def asset(self) -> Asset | None:
         """The nameplate asset URL."""
-        return Asset(
-            f"https://cdn.discordapp.com/assets/collectibles/{self._asset}/",
-            code=self._pallet,
-        )
+        if self._asset_obj is None:
+            self._asset_obj = Asset(
+                f"https://cdn.discordapp.com/assets/collectibles/{self._asset}/",
+                code=self._pallet,
+            )
+        return self._asset_obj
 
     @property
     def expires_at(self) -> datetime.datetime | None:
@@ -85,7 +100,8 @@ class Collectibles:
     __slots__: Final[tuple[str, ...]] = ("_nameplate",)
 
     def __init__(self, collectibles: dict | None) -> None:
-        self._nameplate = Nameplate(collectibles["nameplate"]) if collectibles and "nameplate" in collectibles else None
+        nameplate: dict | None = collectibles.get("nameplate") if collectibles else None
+        self._nameplate: Nameplate | None = Nameplate(nameplate) if nameplate is not None else None
 
     @property
     def nameplate(self) -> Nameplate | None:
@@ -99,13 +115,18 @@ class PrimaryGuild:
         "_identity_enabled",
         "_identity_guild_id",
         "_tag",
+        "_badge_asset",
     )
 
     def __init__(self, data: dict) -> None:
-        self._badge: str | None = data.get("badge")
+        # Guild tags and badges repeat across every member of a guild, so share a single string per value.
+        self._badge: str | None = sys.intern(badge) if (badge := data.get("badge")) else badge
         self._identity_enabled: bool = data.get("identity_enabled", False)
-        self._identity_guild_id: int | None = int(data["identity_guild_id"]) if "identity_guild_id" in data else None
-        self._tag: str | None = data.get("tag")
+        self._identity_guild_id: int | None = (
+            int(guild_id) if (guild_id := data.get("identity_guild_id")) is not None else None
+        )
+        self._tag: str | None = sys.intern(tag) if (tag := data.get("tag")) else tag
+        self._badge_asset: Asset | None = None
 
     @property
     def identity_enabled(self) -> bool:
@@ -127,12 +148,14 @@ class PrimaryGuild:
         """The badge of the primary guild."""
         if self._badge is None:
             return None
-        if self.identity_guild_id is None:
+        if self._identity_guild_id is None:
             return None
-        return Asset(
-            f"https://cdn.discordapp.com/clan-badges/{self.identity_guild_id}/",
-            self._badge,
-        )
+        if self._badge_asset is None:
+            self._badge_asset = Asset(
+                f"https://cdn.discordapp.com/clan-badges/{self._identity_guild_id}/",
+                self._badge,
+            )
+        return self._badge_asset
 
 
 class User:
@@ -145,17 +168,25 @@ class User:
         "_collectibles",
         "_global_name",
         "_public_flags",
+        "_avatar_asset",
+        "_mention",
     )
 
     def __init__(self, data: dict) -> None:
         self._id: int = int(data["id"])
         self._avatar: str | None = data.get("avatar")
-        self._avatar_decoration: dict | None = data.get("avatar_decoration_data")
-        self._primary_guild: dict | None = data.get("primary_guild")
-        self._collectibles: dict[str, dict] | None = data.get("collectibles")
+        self._avatar_decoration: AvatarDecoration | None = (
+            AvatarDecoration(decoration) if (decoration := data.get("avatar_decoration_data")) is not None else None
+        )
+        self._primary_guild: PrimaryGuild | None = (
+            PrimaryGuild(primary_guild) if (primary_guild := data.get("primary_guild")) else None
+        )
+        self._collectibles: Collectibles = Collectibles(data.get("collectibles"))
         self._global_name: str | None = data.get("global_name")
         self._public_flags: int = data.get("public_flags", 0)
         self._username: str = data["username"]
+        self._avatar_asset: Asset | None = None
+        self._mention: str | None = None
 
     @property
     def id(self) -> int:
@@ -166,33 +197,32 @@ class User:
         """The user's avatar."""
         if self._avatar is None:
             return self.default_avatar
-        return Asset(
-            base_url=f"https://cdn.discordapp.com/avatars/{self.id}",
-            code=self._avatar,
-        )
+        if self._avatar_asset is None:
+            self._avatar_asset = Asset(
+                base_url=f"https://cdn.discordapp.com/avatars/{self.id}",
+                code=self._avatar,
+            )
+        return self._avatar_asset
 
     @property
     def default_avatar(self) -> Asset:
         """The default avatar icon."""
-        avatar_id = (self.id >> 22) % NUMBER_OF_DEFAULT_AVATARS
-        return Asset(f"https://cdn.discordapp.com/embed/avatars", str(avatar_id))
+        return _DEFAULT_AVATARS[(self._id >> 22) % NUMBER_OF_DEFAULT_AVATARS]
 
     @property
     def avatar_decoration(self) -> AvatarDecoration | None:
         """The avatar decoration."""
-        if self._avatar_decoration is None:
-            return None
-        return AvatarDecoration(self._avatar_decoration)
+        return self._avatar_decoration
 
     @property
     def primary_guild(self) -> PrimaryGuild | None:
         """The user's primary guild."""
-        return PrimaryGuild(self._primary_guild) if self._primary_guild else None
+        return self._primary_guild
 
     @property
     def collectibles(self) -> Collectibles:
         """The user's collectibles."""
-        return Collectibles(self._collectibles)
+        return self._collectibles
 
     @property
     def global_name(self) -> str | None:
@@ -211,4 +241,6 @@ class User:
 
     @property
     def mention(self) -> str:
-        return f"<@{self.id}>"
+        if self._mention is None:
+            self._mention = f"<@{self._id}>"
+        return self._mention
@@ -25,16 +25,19 @@ SOFTWARE.
 __all__: tuple[str, ...] = (
     "from_timestamp",
     "null_type_to_bool",
+    "drop_nulls",
 )
 
 
 from datetime import datetime, timezone
+from typing import Any
 
 
 def from_timestamp(timestamp: int | float | str) -> datetime:
     if isinstance(timestamp, str):
-        return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-    return datetime.fromtimestamp(float(timestamp), tz=timezone.utc)
+        # fromisoformat accepts a trailing "Z" as UTC on every supported Python version.
+        return datetime.fromisoformat(timestamp)
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
 
 
 def null_type_to_bool(input: dict, key: str) -> bool:
@@ -46,4 +49,9 @@ def null_type_to_bool(input: dict, key: str) -> bool:
     Yes, this is a real Discord API behavior.
     It took me being higher than the Discord engineers to figure this one out.
     """
-    return key in input.keys()
+    return key in input
+
+
+def drop_nulls(payload: dict[str, Any]) -> dict[str, Any]:
+    """Leave unset fields out of a payload rather than sending them as nulls, which Discord treats the same."""
+    return {key: value for key, value in payload.items() if value is not None}